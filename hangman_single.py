@@ -7,57 +7,190 @@ Notes:
 - Single file with Tkinter GUI and CLI fallback.
 - 15-second timer per guess (GUI shows countdown; CLI deducts a life).
 - Two difficulties: basic (word) and intermediate (phrase).
-- Only Python stdlib; no external dependencies.
+- Only Python stdlib; no external dependencies (Python 3.10+).
 """
 
 from __future__ import annotations
 
-import queue
+import math
+import os
 import random
-import string
+import re
+import select
+import sys
 import threading
 import time
+import types
 from dataclasses import dataclass, field
-from typing import Iterable, Optional, Set
+from enum import IntEnum
+from functools import lru_cache
+from typing import Dict, Iterable, NamedTuple, Optional, Set, Tuple
 
 
 # ---------------- Engine (UI-agnostic) ----------------
 
 MASK_CHAR = "_"
 
+# A single ASCII letter, the only guess the engine accepts.
+_GUESS_RE = re.compile(r"[A-Za-z]")
 
+# bytes.translate table that hides every byte but a space behind MASK_CHAR.
+_BLANK_TABLE = bytes(
+    b if b == ord(" ") else ord(MASK_CHAR) for b in range(256)
+)
+
+# Set in answer_mask when the answer holds a character (not A-Z or a
+# space) that no guess can reveal, so such a state is never won.
+_UNGUESSABLE_BIT = 1 << 26
+
+# Anything that is not A-Z or a space is dropped from answers.
+_NON_ANSWER_RE = re.compile(r"[^A-Z ]+")
+
+
+@lru_cache(maxsize=256)
 def _normalize_answer(text: str) -> str:
     """Uppercase and keep only A-Z and spaces (phrases readable)."""
-    text = (text or "").upper()
-    return "".join(
-        ch for ch in text if ch in string.ascii_uppercase + " "
-    ).strip()
+    return _NON_ANSWER_RE.sub("", (text or "").upper()).strip()
+
+
+class _CleanPool(tuple):
+    """Pool entries that have already been through _clean_pool."""
+    __slots__ = ()
+
+
+def _clean_pool(pool: Iterable[str]) -> Tuple[str, ...]:
+    """Strip entries and drop blanks; cleaned pools pass straight through."""
+    if isinstance(pool, _CleanPool):
+        return pool
+    return _CleanPool(p.strip() for p in pool if p and p.strip())
+
+
+def _bit(ch: str) -> int:
+    """Bit for an uppercase letter in a 26-bit guessed mask."""
+    return 1 << (ord(ch) - 65)
+
+
+def _letters_mask(letters: Iterable[str]) -> int:
+    """Mask with the bit of every given letter set."""
+    mask = 0
+    for ch in letters:
+        mask |= _bit(ch)
+    return mask
+
+
+def _answer_mask(answer: str, positions: Dict[str, Tuple[int, ...]]) -> int:
+    """Letters of the answer, plus _UNGUESSABLE_BIT for any other char."""
+    mask = _letters_mask(positions)
+    revealable = answer.count(" ") + sum(map(len, positions.values()))
+    if revealable != len(answer):
+        mask |= _UNGUESSABLE_BIT
+    return mask
+
+
+def _render_guessed(mask: int) -> str:
+    """Guessed letters in A-Z order, space separated."""
+    return " ".join(chr(65 + i) for i in range(26) if (mask >> i) & 1)
+
+
+def _letter_positions(answer: str) -> Dict[str, Tuple[int, ...]]:
+    """Map each A-Z letter of the answer to the indexes where it appears."""
+    found: Dict[str, list] = {}
+    for i, ch in enumerate(answer):
+        if "A" <= ch <= "Z":
+            found.setdefault(ch, []).append(i)
+    return {ch: tuple(idxs) for ch, idxs in found.items()}
 
 
-@dataclass
+def _blank_template(answer: str) -> bytearray:
+    """Display-ready masked answer: letter i sits at offset 2*i."""
+    # "replace" keeps one byte per non-ASCII char so offsets still line up.
+    spaced = " ".join(answer).encode("ascii", "replace")
+    return bytearray(spaced.translate(_BLANK_TABLE))
+
+
+class GameStatus(IntEnum):
+    """Where a game stands; cached on the state after each change."""
+    PLAYING = 0
+    WON = 1
+    LOST = 2
+
+
+class HangmanSnapshot(NamedTuple):
+    """Frozen copy of a game's state at one point in time."""
+    answer: str
+    lives: int
+    guessed: int
+
+
+@dataclass(slots=True)
 class HangmanState:
-    """Snapshot of state for any UI."""
+    """Live state of the current game for any UI.
+
+    ``template``, ``guessed_display`` and ``status`` are cached; code
+    that sets ``lives`` or ``guessed`` directly must call ``resync()``.
+    """
     answer: str
     lives: int
-    guessed: Set[str] = field(default_factory=set)
+    guessed: int = 0
+    # Derived from answer once per game in __post_init__.
+    answer_mask: int = field(init=False, repr=False, compare=False)
+    positions: Dict[str, Tuple[int, ...]] = field(
+        init=False, repr=False, compare=False
+    )
+    template: bytearray = field(init=False, repr=False, compare=False)
+    guessed_display: str = field(
+        default="", init=False, repr=False, compare=False
+    )
+    status: GameStatus = field(
+        default=GameStatus.PLAYING, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Precompute the answer lookups and the revealed template."""
+        self.positions = _letter_positions(self.answer)
+        self.answer_mask = _answer_mask(self.answer, self.positions)
+        self.resync()
+
+    def resync(self) -> None:
+        """Rebuild template, guessed display and status from the fields."""
+        self.template = _blank_template(self.answer)
+        for ch, idxs in self.positions.items():
+            if (self.guessed >> (ord(ch) - 65)) & 1:
+                for i in idxs:
+                    self.template[2 * i] = ord(ch)
+        self.guessed_display = _render_guessed(self.guessed)
+        self.refresh_status()
+
+    def refresh_status(self) -> None:
+        """Recompute status only (enough when just lives changed)."""
+        if (self.answer_mask & ~self.guessed) == 0:
+            self.status = GameStatus.WON
+        elif self.lives <= 0:
+            self.status = GameStatus.LOST
+        else:
+            self.status = GameStatus.PLAYING
+
+    @property
+    def guessed_set(self) -> Set[str]:
+        """Guessed letters as a set (built on demand)."""
+        return {
+            chr(65 + i) for i in range(26) if (self.guessed >> i) & 1
+        }
 
     @property
     def masked(self) -> str:
         """Underscore hidden letters; keep spaces."""
-        return " ".join(
-            ch if (ch == " " or ch in self.guessed) else MASK_CHAR
-            for ch in self.answer
-        )
+        return self.template.decode("ascii")
 
     @property
     def is_won(self) -> bool:
         """True when all letters are guessed."""
-        return all(ch == " " or ch in self.guessed for ch in self.answer)
+        return self.status is GameStatus.WON
 
     @property
     def is_lost(self) -> bool:
         """True when lives are 0 and not already won."""
-        return self.lives <= 0 and not self.is_won
+        return self.status is GameStatus.LOST
 
 
 class HangmanEngine:
@@ -72,75 +205,101 @@ class HangmanEngine:
     ):
         """Create an engine; deterministic RNG helps unit tests."""
         self._rng = rng or random.Random()
-        self._words = [w.strip() for w in words if w and w.strip()]
-        self._phrases = [p.strip() for p in phrases if p and p.strip()]
+        self._words = _clean_pool(words)
+        self._phrases = _clean_pool(phrases)
         if not self._words:
             raise ValueError("words must not be empty")
         if not self._phrases:
             raise ValueError("phrases must not be empty")
+        self._pools = {"basic": self._words, "intermediate": self._phrases}
         self._default_lives = lives
         self._state: Optional[HangmanState] = None
 
     def start(self, difficulty: str = "basic") -> HangmanState:
         """Start a game for 'basic' (word) or 'intermediate' (phrase)."""
-        if difficulty not in {"basic", "intermediate"}:
+        pool = self._pools.get(difficulty)
+        if pool is None:
             raise ValueError(
                 "difficulty must be 'basic' or 'intermediate'"
             )
-        pool = self._words if difficulty == "basic" else self._phrases
         raw = self._rng.choice(pool)
         self._state = HangmanState(
             answer=_normalize_answer(raw),
             lives=self._default_lives,
-            guessed=set(),
         )
         return self.state
 
     @property
     def state(self) -> HangmanState:
-        """Current state snapshot (raises if not started)."""
+        """Current live state (raises if not started).
+
+        Prefer guess()/timeout() to writing its fields; see HangmanState.
+        """
         if self._state is None:
             raise RuntimeError("game not started")
         return self._state
 
+    def snapshot(self) -> HangmanSnapshot:
+        """Frozen copy of the current state (raises if not started)."""
+        st = self.state
+        return HangmanSnapshot(st.answer, st.lives, st.guessed)
+
     def guess(self, letter: str) -> HangmanState:
         """Apply a single-letter guess. Invalid/repeat guesses ignored."""
         if self._state is None:
             raise RuntimeError("game not started")
-        if self._state.is_won or self._state.is_lost:
+        if self._state.status is not GameStatus.PLAYING:
             return self._state
 
-        letter = (letter or "").strip().upper()
-        if len(letter) != 1 or letter not in string.ascii_uppercase:
-            return self._state
-        if letter in self._state.guessed:
+        match = _GUESS_RE.fullmatch((letter or "").strip())
+        if match is None:
             return self._state
+        return self.guess_many(match.group())
 
-        guessed = set(self._state.guessed)
-        guessed.add(letter)
-        new_lives = self._state.lives - (
-            0 if letter in self._state.answer else 1
-        )
-        self._state = HangmanState(
-            answer=self._state.answer,
-            lives=new_lives,
-            guessed=guessed,
-        )
-        return self._state
+    def guess_many(self, letters: str) -> HangmanState:
+        """Apply each letter in order; stops once the game is over.
+
+        Non A-Z characters and repeats are skipped, as in guess().
+        """
+        if self._state is None:
+            raise RuntimeError("game not started")
+        st = self._state
+        if st.status is not GameStatus.PLAYING:
+            return st
+
+        guessed = st.guessed
+        lives = st.lives
+        answer_mask = st.answer_mask
+        for ch in letters or "":
+            if not ch.isascii():  # "ı"/"ß" would upper() into A-Z
+                continue
+            ch = ch.upper()
+            idx = ord(ch) - 65
+            if not 0 <= idx < 26 or (guessed >> idx) & 1:
+                continue
+            guessed |= 1 << idx
+            lives -= 1 - ((answer_mask >> idx) & 1)
+            for i in st.positions.get(ch, ()):
+                st.template[2 * i] = ord(ch)
+            if lives <= 0 or (answer_mask & ~guessed) == 0:
+                break
+
+        if guessed != st.guessed:
+            st.guessed = guessed
+            st.lives = lives
+            st.guessed_display = _render_guessed(guessed)
+            st.refresh_status()
+        return st
 
     def timeout(self) -> HangmanState:
         """Deduct one life when the UI reports a 15s timeout."""
         if self._state is None:
             raise RuntimeError("game not started")
-        if self._state.is_won or self._state.is_lost:
+        if self._state.status is not GameStatus.PLAYING:
             return self._state
 
-        new_lives = max(self._state.lives - 1, 0)
-        self._state = HangmanState(
-            answer=self._state.answer,
-            lives=new_lives,
-            guessed=set(self._state.guessed),
-        )
+        self._state.lives = max(self._state.lives - 1, 0)
+        self._state.refresh_status()
         return self._state
 
 
@@ -220,6 +379,10 @@ PHRASES = [
     "SEPARATION OF CONCERNS",
 ]
 
+# Cleaned once at import so every new engine reuses the same pools.
+_WORDS_CLEAN = _clean_pool(WORDS)
+_PHRASES_CLEAN = _clean_pool(PHRASES)
+
 
 # ---------------- Tkinter GUI (with 15s timer) ----------------
 
@@ -234,7 +397,7 @@ def run_gui() -> None:
         print("GUI unavailable (ImportError):", exc)
         raise
 
-    engine = HangmanEngine(WORDS, PHRASES, lives=6)
+    engine = HangmanEngine(_WORDS_CLEAN, _PHRASES_CLEAN, lives=6)
 
     root = tk.Tk()
     root.title("Hangman TDD S388441 (PRT582)")
@@ -248,9 +411,7 @@ def run_gui() -> None:
     answer_var = tk.StringVar(value="")
     difficulty = tk.StringVar(value="basic")
 
-    timer_seconds = {"value": 15}
-    timer_thread = {"value": None}  # type: ignore
-    timer_stop = {"event": None}    # type: ignore
+    timer = types.SimpleNamespace(seconds=15, deadline=0.0, after_id=None)
 
     def _entry_validator(text_after: str) -> bool:
         """Allow only 0-1 chars and only letters."""
@@ -258,7 +419,7 @@ def run_gui() -> None:
             return False
         if text_after == "":
             return True
-        return text_after.isalpha()
+        return text_after.isascii() and text_after.isalpha()
 
     vcmd = (root.register(_entry_validator), "%P")
 
@@ -273,8 +434,7 @@ def run_gui() -> None:
         st = engine.state
         mask_var.set(st.masked)
         lives_var.set(f"Lives: {st.lives}")
-        guessed_sorted = " ".join(sorted(st.guessed)) if st.guessed else ""
-        guessed_var.set(f"Guessed: {guessed_sorted}")
+        guessed_var.set(f"Guessed: {st.guessed_display}")
         if st.is_won:
             answer_var.set("Correct! You guessed it.")
             stop_timer()
@@ -302,56 +462,37 @@ def run_gui() -> None:
             restart_timer()
 
     def stop_timer() -> None:
-        """Signal the current timer thread to stop and join it."""
-        ev = timer_stop["event"]
-        thr = timer_thread["value"]
-        if ev is not None:
-            ev.set()
-        if (
-            thr is not None
-            and thr.is_alive()
-            and thr is not threading.current_thread()
-        ):
-            try:
-                thr.join(timeout=1.0)
-            except Exception:  # pylint: disable=broad-exception-caught
-                pass
-        timer_thread["value"] = None
-        timer_stop["event"] = None
+        """Cancel the pending timer tick, if any."""
+        if timer.after_id is not None:
+            root.after_cancel(timer.after_id)
+            timer.after_id = None
 
     def restart_timer() -> None:
-        """Safely stop any old timer and start a fresh 15s timer."""
+        """Cancel any pending tick and start a fresh 15s countdown."""
         stop_timer()
-        timer_seconds["value"] = 15
-        timer_var.set(f"Time left: {timer_seconds['value']}s")
-        ev = threading.Event()
-        timer_stop["event"] = ev
-        t_thr = threading.Thread(
-            target=timer_loop,
-            args=(ev,),
-            daemon=True,
-        )
-        timer_thread["value"] = t_thr
-        t_thr.start()
-
-    def timer_loop(stop_event: threading.Event) -> None:
-        """Decrement timer each sec; trigger timeout at zero."""
-        next_tick = time.monotonic() + 1.0
-        while (not stop_event.is_set()) and timer_seconds["value"] > 0:
-            now = time.monotonic()
-            sleep_for = max(0.0, next_tick - now)
-            if sleep_for > 0:
-                time.sleep(sleep_for)
-            next_tick += 1.0
-            if stop_event.is_set():
-                return
-            timer_seconds["value"] -= 1
-            timer_var.set(f"Time left: {timer_seconds['value']}s")
-        if (not stop_event.is_set()) and timer_seconds["value"] <= 0:
-            engine.timeout()
-            update_view()
-            if not engine.state.is_won and not engine.state.is_lost:
-                restart_timer()
+        timer.seconds = 15
+        timer.deadline = time.monotonic() + timer.seconds
+        timer_var.set(f"Time left: {timer.seconds}s")
+        schedule_tick()
+
+    def schedule_tick() -> None:
+        """Schedule the next tick on the deadline so lag never adds up."""
+        due = timer.deadline - (timer.seconds - 1)
+        delay_ms = max(0, int((due - time.monotonic()) * 1000))
+        timer.after_id = root.after(delay_ms, timer_tick)
+
+    def timer_tick() -> None:
+        """Decrement timer each sec on the Tk loop; timeout at zero."""
+        timer.after_id = None
+        timer.seconds -= 1
+        timer_var.set(f"Time left: {timer.seconds}s")
+        if timer.seconds > 0:
+            schedule_tick()
+            return
+        engine.timeout()
+        update_view()
+        if not engine.state.is_won and not engine.state.is_lost:
+            restart_timer()
 
     # GUI layout
 
@@ -447,17 +588,50 @@ def run_gui() -> None:
 
 # ---------------- CLI fallback (with real 15s timeout) ----------------
 
-def timed_input(prompt: str, timeout: int) -> Optional[str]:
-    """Blocking input with a deadline; None on timeout."""
-    print(prompt, end="", flush=True)
-    q: "queue.Queue[str]" = queue.Queue()
+def _stdin_selectable() -> bool:
+    """True when stdin is a POSIX tty that select() can wait on.
+
+    Pipes are excluded: earlier input() calls may have buffered lines
+    that select() on the raw fd would never report.
+    """
+    if os.name != "posix":
+        return False
+    try:
+        return sys.stdin.isatty()
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+def _timed_input_select(timeout: int) -> Optional[str]:
+    """Wait for a stdin line with select(); None on timeout."""
+    deadline = time.monotonic() + timeout
+    shown = None
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        secs = math.ceil(remaining)
+        if secs != shown:
+            print(f"\rTime left: {secs:2d}s   ", end="", flush=True)
+            shown = secs
+        # Wake at the next whole second to repaint the countdown.
+        ready, _, _ = select.select(
+            [sys.stdin], [], [], remaining - (secs - 1)
+        )
+        if ready:
+            return sys.stdin.readline().strip()
+
+
+def _timed_input_thread(timeout: int) -> Optional[str]:
+    """Read stdin on a helper thread; None on timeout (Windows/pipes)."""
+    # One writer (the reader thread), read only after it has finished.
+    result = [""]
 
     def _reader() -> None:
         try:
-            line = input()
+            result[0] = input()
         except Exception:  # pylint: disable=broad-exception-caught
-            line = ""
-        q.put(line)
+            result[0] = ""
 
     t_thr = threading.Thread(target=_reader, daemon=True)
     t_thr.start()
@@ -469,15 +643,26 @@ def timed_input(prompt: str, timeout: int) -> Optional[str]:
         remaining -= 1
 
     if t_thr.is_alive():
-        print("\nTime's up!")
         return None
-    return q.get().strip()
+    return result[0].strip()
+
+
+def timed_input(prompt: str, timeout: int) -> Optional[str]:
+    """Blocking input with a deadline; None on timeout."""
+    print(prompt, end="", flush=True)
+    if _stdin_selectable():
+        line = _timed_input_select(timeout)
+    else:
+        line = _timed_input_thread(timeout)
+    if line is None:
+        print("\nTime's up!")
+    return line
 
 
 def run_cli() -> None:
     """Run the CLI version with a 15s countdown per guess."""
     print("Hangman Game (PRT582) [CLI]")
-    engine = HangmanEngine(WORDS, PHRASES, lives=6)
+    engine = HangmanEngine(_WORDS_CLEAN, _PHRASES_CLEAN, lives=6)
 
     prompt = "Choose difficulty [basic/intermediate]: "
     diff_raw = input(prompt).strip().lower() or "basic"
@@ -488,9 +673,8 @@ def run_cli() -> None:
 
     while True:
         st = engine.state
-        guessed_str = " ".join(sorted(st.guessed))
         print(f"\n{st.masked}")
-        print(f"Lives: {st.lives}  Guessed: {guessed_str}")
+        print(f"Lives: {st.lives}  Guessed: {st.guessed_display}")
 
         if st.is_won:
             print("Correct! You guessed it right.")
@@ -7,11 +7,15 @@ Covers:
 - Lives deducted on wrong guesses and timeouts
 - Invalid / repeat guesses do not change lives
 - No state change after win; no negative lives after loss
+- Batch guesses, frozen snapshots and cached status/display
 """
 
+import os
+import subprocess
+import sys
 import unittest
 import random
-from hangman_single import HangmanEngine, MASK_CHAR
+from hangman_single import GameStatus, HangmanEngine, HangmanState, MASK_CHAR
 
 WORDS = ["PYTHON", "QUALITY", "DEBUG"]
 PHRASES = ["UNIT TESTS", "CLEAN CODE"]
@@ -48,6 +52,52 @@ class TestHangmanSingle(unittest.TestCase):
         self.assertTrue(st.is_won)
         self.assertFalse(st.is_lost)
 
+    def test_repeated_letters_win(self):
+        """Each distinct letter only needs guessing once to win."""
+        eng = HangmanEngine(["ABRACADABRA"], ["X Y"], lives=1, rng=self.rng)
+        eng.start("basic")
+        for letter in "ABRC":
+            eng.guess(letter)
+        self.assertFalse(eng.state.is_won)
+        st = eng.guess("D")
+        self.assertTrue(st.is_won)
+        self.assertEqual(st.lives, 1)
+
+    def test_status_follows_game(self):
+        """Status moves from playing to won or lost as the game ends."""
+        eng = HangmanEngine(["AB"], ["X Y"], lives=1, rng=self.rng)
+        self.assertIs(eng.start("basic").status, GameStatus.PLAYING)
+        self.assertIs(eng.guess("A").status, GameStatus.PLAYING)
+        self.assertIs(eng.guess("B").status, GameStatus.WON)
+        eng.start("basic")
+        self.assertIs(eng.timeout().status, GameStatus.LOST)
+
+    def test_resync_after_direct_write(self):
+        """Direct field writes take effect once resync() runs."""
+        st = HangmanState(answer="AB", lives=2)
+        st.lives = 0
+        st.resync()
+        self.assertTrue(st.is_lost)
+
+        st = HangmanState(answer="AB", lives=3)
+        st.guessed = 0b11
+        st.resync()
+        self.assertTrue(st.is_won)
+        self.assertEqual(st.masked, "A B")
+        self.assertEqual(st.guessed_display, "A B")
+
+    def test_guess_many_applies_in_order(self):
+        """Batch guesses skip junk/repeats and stop when the game ends."""
+        eng = HangmanEngine(["ABC"], ["X Y"], lives=2, rng=self.rng)
+        eng.start("basic")
+        st = eng.guess_many("a1aZ\u0131\u00df")
+        self.assertEqual(st.guessed_display, "A Z")
+        self.assertEqual(st.lives, 1)
+        st = eng.guess_many("YBC")
+        self.assertTrue(st.is_lost)
+        self.assertEqual(st.guessed_display, "A Y Z")
+        self.assertEqual(st.lives, 0)
+
     def test_wrong_guesses_lose(self):
         """Two wrong guesses with 2 lives causes loss."""
         eng = HangmanEngine(["A"], ["B C"], lives=2, rng=self.rng)
@@ -80,6 +130,66 @@ class TestHangmanSingle(unittest.TestCase):
         self.assertIn("A", eng.state.masked)
         self.assertNotIn("B", eng.state.masked.replace(" ", ""))
 
+    def test_masking_phrase_keeps_gaps(self):
+        """Phrase masking keeps word gaps and reveals every position."""
+        eng = HangmanEngine(["ABC"], ["UNIT TESTS"], lives=3, rng=self.rng)
+        eng.start("intermediate")
+        self.assertEqual(eng.state.masked, "_ _ _ _   _ _ _ _ _")
+        eng.guess("T")
+        self.assertEqual(eng.state.masked, "_ _ _ T   T _ _ T _")
+
+    def test_guessed_set_tracks_letters(self):
+        """Guessed letters are exposed as a set of uppercase letters."""
+        eng = HangmanEngine(["ABC"], ["X Y"], lives=3, rng=self.rng)
+        eng.start("basic")
+        eng.guess("c")
+        eng.guess("Z")
+        self.assertEqual(eng.state.guessed_set, {"C", "Z"})
+        self.assertEqual(eng.state.guessed_display, "C Z")
+
+    def test_snapshot_is_frozen(self):
+        """Snapshots keep their values while the live state moves on."""
+        eng = HangmanEngine(["ABC"], ["X Y"], lives=3, rng=self.rng)
+        eng.start("basic")
+        snap = eng.snapshot()
+        eng.guess("Z")
+        self.assertEqual(snap.lives, 3)
+        self.assertEqual(snap.guessed, 0)
+        self.assertEqual(eng.snapshot().lives, 2)
+
+    def test_state_with_unguessable_chars(self):
+        """Non A-Z answer characters never reveal and never allow a win."""
+        expected = {"R2D2": "R _ D _", "abc": "_ _ _", "\u00e9 a": "_   _"}
+        for answer, masked in expected.items():
+            st = HangmanState(answer=answer, lives=3, guessed=(1 << 26) - 1)
+            self.assertFalse(st.is_won)
+            self.assertEqual(st.masked, masked)
+
+    def test_timed_input_reads_buffered_pipe_lines(self):
+        """Lines already sent down an open pipe are read, not timed out."""
+        script = (
+            "from hangman_single import timed_input\n"
+            "input()\n"
+            "print(repr(timed_input('', 5)), repr(timed_input('', 5)))\n"
+        )
+        with subprocess.Popen(
+            [sys.executable, "-c", script],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        ) as proc:
+            proc.stdin.write("basic\nE\nA\n")
+            proc.stdin.flush()  # keep the pipe open, like a live driver
+            try:
+                proc.wait(timeout=8)
+            finally:
+                proc.stdin.close()
+            out = proc.stdout.read()
+            err = proc.stderr.read()
+        self.assertIn("'E' 'A'", out, err)
+
     def test_invalid_guess_ignored(self):
         """Non-letters and multi-char inputs are ignored."""
         eng = HangmanEngine(["ABC"], ["X Y"], lives=3, rng=self.rng)
@@ -98,14 +208,14 @@ class TestHangmanSingle(unittest.TestCase):
 
         before_lives = eng.state.lives
         before_masked = eng.state.masked
-        before_guessed = set(eng.state.guessed)
+        before_guessed = eng.state.guessed_set
 
         eng.guess("Z")  # ignored post-win
 
         self.assertTrue(eng.state.is_won)
         self.assertEqual(eng.state.lives, before_lives)
         self.assertEqual(eng.state.masked, before_masked)
-        self.assertEqual(set(eng.state.guessed), before_guessed)
+        self.assertEqual(eng.state.guessed_set, before_guessed)
 
     def test_no_negative_lives_after_loss(self):
         """Lives never go below zero after loss and extra timeouts."""